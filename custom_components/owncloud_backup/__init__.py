@@ -4,16 +4,19 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .const import (
     CONF_BACKUP_PATH,
     CONF_BASE_URL,
+    CONF_DAV_ROOT,
+    CONF_EXPECT_CONTINUE,
     CONF_PASSWORD,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
     DATA_BACKUP_AGENT_LISTENERS,
     DATA_CLIENT,
+    DATA_SESSION,
     DOMAIN,
 )
 from .webdav_client import WebDavClient
@@ -27,9 +30,28 @@ def _notify_backup_listeners(hass: HomeAssistant) -> None:
         listener()
 
 
+def _expect_continue_enabled(entry: ConfigEntry) -> bool:
+    """Options override the value chosen when the entry was created."""
+    return entry.options.get(CONF_EXPECT_CONTINUE, entry.data.get(CONF_EXPECT_CONTINUE, True))
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running client (no reload needed)."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is not None:
+        entry_data[DATA_CLIENT].set_expect_continue(_expect_continue_enabled(entry))
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up ownCloud Backup from a config entry."""
-    session = async_get_clientsession(hass, verify_ssl=entry.data[CONF_VERIFY_SSL])
+    # Own session per entry, built by HA so its connector (resolver incl. mDNS
+    # `.local` names, SSL context, User-Agent) is used; HA closes it on shutdown.
+    session = async_create_clientsession(hass, verify_ssl=entry.data[CONF_VERIFY_SSL])
+
+    @callback
+    def _store_dav_root(root: str) -> None:
+        if entry.data.get(CONF_DAV_ROOT) != root:
+            hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_DAV_ROOT: root})
 
     client = WebDavClient(
         session=session,
@@ -37,6 +59,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
         backup_path=entry.data[CONF_BACKUP_PATH],
+        dav_root=entry.data.get(CONF_DAV_ROOT),
+        on_root_detected=_store_dav_root,
+        expect_continue=_expect_continue_enabled(entry),
     )
 
     # Ensure folder exists (best-effort). If this fails, the integration still loads,
@@ -47,7 +72,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.warning("Could not ensure backup folder exists: %s", err)
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {DATA_CLIENT: client}
+    hass.data[DOMAIN][entry.entry_id] = {DATA_CLIENT: client, DATA_SESSION: session}
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     # Notify HA to reload backup agents when entry state changes
     entry.async_on_unload(entry.async_on_state_change(lambda: _notify_backup_listeners(hass)))
@@ -58,6 +85,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload config entry."""
-    hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    entry_data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     _notify_backup_listeners(hass)
+    if entry_data is not None:
+        await entry_data[DATA_SESSION].close()
     return True
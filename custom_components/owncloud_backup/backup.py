@@ -21,8 +21,9 @@ from .const import (
     DATA_BACKUP_AGENT_LISTENERS,
     DATA_CLIENT,
     DOMAIN,
+    META_FETCH_CONCURRENCY,
     META_SUFFIX,
-    SPOOL_FLUSH_BYTES,
+    PENDING_SUFFIX,
     TAR_PREFIX,
     TAR_SUFFIX,
 )
@@ -30,6 +31,23 @@ from .webdav_client import WebDavClient
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def _json_loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
 
 def _make_tar_name(backup_id: str) -> str:
     return f"{TAR_PREFIX}{backup_id}{TAR_SUFFIX}"
@@ -107,42 +125,45 @@ def _agentbackup_from_dict(d: dict[str, Any]) -> AgentBackup:
 
 async def _spool_stream_to_tempfile(stream: AsyncIterator[bytes]) -> tuple[str, int]:
     """Spool an async byte stream into a temporary file and return (path, size)."""
-    fd, path = tempfile.mkstemp(prefix="owncloud_backup_", suffix=".tar")
-    os.close(fd)
+    # Keep the descriptor from mkstemp open for the whole spool; only the
+    # individual writes are dispatched to the executor.
+    fd, path = await asyncio.to_thread(
+        tempfile.mkstemp, prefix="owncloud_backup_", suffix=".tar"
+    )
 
     size = 0
-    buf = bytearray()
 
     try:
-        async for chunk in stream:
-            if not chunk:
-                continue
-            buf.extend(chunk)
-            size += len(chunk)
-
-            if len(buf) >= SPOOL_FLUSH_BYTES:
-                data = bytes(buf)
-                buf.clear()
-                await asyncio.to_thread(_write_bytes_to_file, path, data, append=True)
-
-        if buf:
-            await asyncio.to_thread(_write_bytes_to_file, path, bytes(buf), append=True)
+        try:
+            # Chunks are already bytes; write them as they arrive, no accumulator.
+            async for chunk in stream:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                await asyncio.to_thread(_write_all, fd, chunk)
+        finally:
+            await asyncio.to_thread(os.close, fd)
 
         return path, size
 
     except Exception:
-        try:
-            os.remove(path)
-        except OSError:
-            pass
+        await _async_remove_quietly(path)
         raise
 
 
-def _write_bytes_to_file(path: str, data: bytes, *, append: bool) -> None:
-    mode = "ab" if append else "wb"
-    with open(path, mode) as f:
-        f.write(data)
-        f.flush()
+async def _async_remove_quietly(path: str) -> None:
+    """Remove a file in the executor, ignoring errors."""
+    try:
+        await asyncio.to_thread(os.remove, path)
+    except OSError:
+        pass
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
 
 
 class OwnCloudBackupAgent(BackupAgent):
@@ -154,6 +175,8 @@ class OwnCloudBackupAgent(BackupAgent):
 
     def __init__(self, client: WebDavClient) -> None:
         self._client = client
+        # Shared across calls so overlapping listings stay under one cap.
+        self._meta_sem = asyncio.Semaphore(META_FETCH_CONCURRENCY)
 
     async def async_upload_backup(
         self,
@@ -162,50 +185,81 @@ class OwnCloudBackupAgent(BackupAgent):
         backup: AgentBackup,
         **kwargs: Any,
     ) -> None:
-        """Upload a backup + metadata sidecar (spooled for non-chunked PUT)."""
+        """Upload a backup + metadata sidecar (non-chunked PUT).
+
+        If the backup size is known, the tar stream is piped directly into the
+        PUT with Content-Length; otherwise it is spooled to a temp file first.
+        """
         temp_path: str | None = None
         try:
             tar_name = _make_tar_name(backup.backup_id)
             meta_name = _make_meta_name(backup.backup_id)
+            pending_meta_name = f"{meta_name}{PENDING_SUFFIX}"
 
-            # 1) Spool tar stream to temp file
-            stream = await open_stream()
-            temp_path, size = await _spool_stream_to_tempfile(stream)
-
-            # 2) Upload tar file with Content-Length
-            await self._client.put_file(tar_name, temp_path, size)
-
-            # 3) Upload normalized metadata JSON
             meta_dict = _agentbackup_to_dict(backup)
-            meta_bytes = json.dumps(meta_dict, ensure_ascii=False).encode("utf-8")
-            await self._client.put_bytes(meta_name, meta_bytes)
+            meta_bytes = _json_dumps(meta_dict)
+
+            async def upload_tar() -> None:
+                nonlocal temp_path
+                stream = await open_stream()
+                if backup.size and backup.size > 0:
+                    # Stream tar directly with Content-Length
+                    await self._client.put_async_iter(tar_name, stream, backup.size)
+                else:
+                    # Spool tar stream to temp file, then upload with Content-Length
+                    temp_path, size = await _spool_stream_to_tempfile(stream)
+                    await self._client.put_file(tar_name, temp_path, size)
+
+            try:
+                # 1) Upload tar and metadata (under a pending name) concurrently
+                results = await asyncio.gather(
+                    upload_tar(),
+                    self._client.put_bytes(pending_meta_name, meta_bytes),
+                    return_exceptions=True,
+                )
+                errors = [result for result in results if isinstance(result, BaseException)]
+                if errors:
+                    for extra in errors[1:]:
+                        _LOGGER.warning("Metadata upload for %s also failed: %s", backup.backup_id, extra)
+                    raise errors[0]
+
+                # 2) Publish metadata only once the tar is complete, so a partial
+                # upload never leaves a sidecar pointing at a missing tar.
+                await self._client.move(pending_meta_name, meta_name)
+            except Exception:
+                await self._discard_pending(pending_meta_name)
+                raise
 
         except Exception as err:  # noqa: BLE001
             raise BackupAgentError(f"Upload to ownCloud failed: {err}") from err
         finally:
             if temp_path:
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    pass
+                await _async_remove_quietly(temp_path)
+
+    async def _discard_pending(self, pending_name: str) -> None:
+        """Best-effort removal of an unpublished metadata sidecar."""
+        try:
+            await self._client.delete(pending_name)
+        except FileNotFoundError:
+            pass
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Could not remove %s: %s", pending_name, err)
 
     async def async_list_backups(self, **kwargs: Any) -> list[AgentBackup]:
         """List backups by reading metadata sidecars; fallback to tar stat if missing."""
         try:
-            names = await self._client.listdir()
+            entries = {str(e["name"]): e for e in await self._client.listdir()}
 
-            meta_files = {n for n in names if n.startswith(TAR_PREFIX) and n.endswith(META_SUFFIX)}
-            tar_files = {n for n in names if n.startswith(TAR_PREFIX) and n.endswith(TAR_SUFFIX)}
+            meta_files = {n for n in entries if n.startswith(TAR_PREFIX) and n.endswith(META_SUFFIX)}
+            tar_files = {n for n in entries if n.startswith(TAR_PREFIX) and n.endswith(TAR_SUFFIX)}
 
             backups: list[AgentBackup] = []
 
-            sem = asyncio.Semaphore(5)
-
             async def fetch_meta(meta_name: str) -> None:
-                async with sem:
+                async with self._meta_sem:
                     raw = await self._client.get_bytes(meta_name)
                 try:
-                    d = json.loads(raw.decode("utf-8"))
+                    d = _json_loads(raw)
                     backups.append(_agentbackup_from_dict(d))
                 except Exception as err:  # noqa: BLE001
                     _LOGGER.warning("Skipping invalid metadata %s: %s", meta_name, err)
@@ -218,7 +272,8 @@ class OwnCloudBackupAgent(BackupAgent):
                 if backup_id in known_ids:
                     continue
 
-                info = await self._client.stat(tar_name)
+                # Size and mtime come with the listing; no extra PROPFIND needed.
+                info = entries[tar_name]
                 d = _normalize_backup_dict(
                     {
                         "backup_id": backup_id,
@@ -249,7 +304,7 @@ class OwnCloudBackupAgent(BackupAgent):
 
         try:
             raw = await self._client.get_bytes(meta_name)
-            d = json.loads(raw.decode("utf-8"))
+            d = _json_loads(raw)
             return _agentbackup_from_dict(d)
         except FileNotFoundError:
             pass
@@ -298,6 +353,8 @@ class OwnCloudBackupAgent(BackupAgent):
         tar_missing = False
         meta_missing = False
 
+        # Sequential on purpose: if the tar DELETE fails (e.g. 423 Locked), the
+        # sidecar must survive, or the tar would be listed with default metadata.
         try:
             await self._client.delete(tar_name)
         except FileNotFoundError:
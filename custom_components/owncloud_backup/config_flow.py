@@ -6,12 +6,13 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     CONF_BACKUP_PATH,
     CONF_BASE_URL,
+    CONF_EXPECT_CONTINUE,
     CONF_PASSWORD,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
@@ -29,6 +30,7 @@ STEP_USER_SCHEMA = vol.Schema(
         vol.Required(CONF_PASSWORD): str,
         vol.Optional(CONF_BACKUP_PATH, default="/HomeAssistant/Backups"): str,
         vol.Optional(CONF_VERIFY_SSL, default=True): bool,
+        vol.Optional(CONF_EXPECT_CONTINUE, default=True): bool,
     }
 )
 
@@ -44,7 +46,7 @@ async def _validate_input(hass: HomeAssistant, data: dict[str, Any]) -> None:
         backup_path=data[CONF_BACKUP_PATH],
     )
     await client.ensure_backup_folder()
-    await client.listdir()
+    await client.listdir_names()
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -52,6 +54,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        return OptionsFlow()
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
 
@@ -70,3 +79,21 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_SCHEMA,
             errors=errors,
         )
+
+
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle options for ownCloud Backup."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        current = self.config_entry.options.get(
+            CONF_EXPECT_CONTINUE, self.config_entry.data.get(CONF_EXPECT_CONTINUE, True)
+        )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {vol.Optional(CONF_EXPECT_CONTINUE, default=current): bool}
+            ),
+        )
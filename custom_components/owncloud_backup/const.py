@@ -7,13 +7,19 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_BACKUP_PATH = "backup_path"
 CONF_VERIFY_SSL = "verify_ssl"
+CONF_EXPECT_CONTINUE = "expect_continue"
+# Detected DAV root, persisted so restarts skip discovery
+CONF_DAV_ROOT = "dav_root"
 
 DATA_CLIENT = "client"
+DATA_SESSION = "session"
 DATA_BACKUP_AGENT_LISTENERS = "backup_agent_listeners"
 
 TAR_PREFIX = "ha_backup_"
 TAR_SUFFIX = ".tar"
 META_SUFFIX = ".json"
+# Metadata is uploaded under this extra suffix and renamed once the tar is complete
+PENDING_SUFFIX = ".pending"
 
-# Spooling to temp file to avoid chunked WebDAV uploads
-SPOOL_FLUSH_BYTES = 1024 * 1024  # 1 MiB
+# Upper bound for concurrent metadata sidecar downloads while listing
+META_FETCH_CONCURRENCY = 16
@@ -1,23 +1,76 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 import os
+import re
+import time
 import xml.etree.ElementTree as ET
-from collections.abc import AsyncIterator
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from types import MappingProxyType
 from typing import Final
 from urllib.parse import quote, urljoin
+from xml.sax.saxutils import escape as xml_escape
 
 import aiohttp
 from aiohttp import ClientResponseError, ClientSession
 from yarl import URL
 
+try:
+    from lxml.etree import XMLPullParser, XMLSyntaxError
+
+    XML_PARSE_ERRORS: tuple[type[Exception], ...] = (XMLSyntaxError, ET.ParseError)
+except ImportError:  # pragma: no cover - lxml is optional; used when installed
+    from xml.etree.ElementTree import XMLPullParser
+
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
 _LOGGER = logging.getLogger(__name__)
 
 DAV_NS: Final = "{DAV:}"
 
+# File names that are URL-safe as-is (no leading dot, so never "." or "..")
+_SAFE_NAME: Final = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9._-]*$")
+
+# Properties requested for every folder listing entry
+_LISTDIR_PROPS: Final = (
+    b"<d:prop><d:displayname/><d:getcontentlength/><d:getlastmodified/><d:resourcetype/></d:prop>"
+)
+
+# Consecutive server errors on sync-collection REPORT before it is no longer tried
+SYNC_MAX_FAILURES: Final = 3
+
+# Read size when streaming PROPFIND responses into the XML parser
+PROPFIND_READ_CHUNK: Final = 64 * 1024
+
+# PUTs larger than this send Expect: 100-continue (when enabled)
+EXPECT_CONTINUE_MIN_BYTES: Final = 1024 * 1024
+# How long to wait for 100 Continue (or a final response) before giving up
+EXPECT_CONTINUE_TIMEOUT: Final = 30.0
+
+# Read size when streaming a local file into an upload
+UPLOAD_READ_CHUNK: Final = 256 * 1024
+
+# Short-lived cache for folder listings (UI polls list backups repeatedly)
+LISTDIR_CACHE_TTL: Final = 30.0
+# Max number of small file bodies (metadata sidecars) kept in memory
+BYTES_CACHE_MAX_ENTRIES: Final = 128
+# Cached bodies older than this are revalidated with their ETag
+BYTES_CACHE_TTL: Final = 300.0
+
+
+@dataclass
+class _MultistatusState:
+    """Parser state carried across chunks of a streamed multistatus body."""
+
+    root: ET.Element | None = None
+    token: str | None = None
+
 
 class WebDavClient:
     """Minimal WebDAV client for ownCloud Classic.
@@ -27,6 +80,14 @@ class WebDavClient:
     - remote.php/webdav/
     """
 
+    _H_DEPTH0: Final = MappingProxyType({"Depth": "0"})
+    _H_DEPTH0_XML: Final = MappingProxyType(
+        {"Depth": "0", "Content-Type": "application/xml; charset=utf-8"}
+    )
+    _H_DEPTH1_XML: Final = MappingProxyType(
+        {"Depth": "1", "Content-Type": "application/xml; charset=utf-8"}
+    )
+
     def __init__(
         self,
         *,
@@ -35,39 +96,64 @@ class WebDavClient:
         username: str,
         password: str,
         backup_path: str,
+        dav_root: str | None = None,
+        on_root_detected: Callable[[str], None] | None = None,
+        expect_continue: bool = True,
     ) -> None:
         self._session = session
         self._base_url = base_url.rstrip("/") + "/"
         self._username = username
         self._password = password
+        token = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
+        self._auth = f"Basic {token}"
+        self._base_headers: dict[str, str] = {"Authorization": self._auth}
+        # Static per-verb header sets, merged with the auth header once
+        self._prebuilt_headers: tuple[tuple[Mapping[str, str], dict[str, str]], ...] = tuple(
+            (template, {**self._base_headers, **template})
+            for template in (self._H_DEPTH0, self._H_DEPTH0_XML, self._H_DEPTH1_XML)
+        )
         self._backup_path = backup_path.strip()
+        # Folder path relative to the DAV root, and its last segment
+        self._folder_rel = self._backup_path.lstrip("/")
+        self._folder_leaf = self._folder_rel.rstrip("/").split("/")[-1]
 
         self._dav_roots = [
             f"remote.php/dav/files/{quote(username)}/",
             "remote.php/webdav/",
         ]
-        self._cached_root: str | None = None
+        # A root detected in a previous run (persisted by the caller) skips discovery.
+        self._cached_root: str | None = dav_root if dav_root in self._dav_roots else None
+        # Until confirmed, a persisted root may be stale (server migrated, endpoint disabled).
+        self._root_prefilled = self._cached_root is not None
+        self._on_root_detected = on_root_detected
+        self._expect_continue = expect_continue
+        self._cached_folder_url: str | None = None
+
+        self._listdir_cache: tuple[float, list[dict[str, object]]] | None = None
+        # Bumped on every write; responses fetched across a bump are not cached.
+        self._cache_generation = 0
+        self._listdir_ttl = LISTDIR_CACHE_TTL
+        # Incremental listing state (sync-collection REPORT); None = not probed yet
+        self._sync_supported: bool | None = None
+        self._sync_token: str | None = None
+        self._sync_entries: dict[str, dict[str, object]] | None = None
+        self._sync_failures = 0
+        # name -> (fetched_at, etag, body)
+        self._bytes_cache: OrderedDict[str, tuple[float, str | None, bytes]] = OrderedDict()
 
         # Non-restrictive client timeouts for potentially long WebDAV operations
         self._timeout_long = aiohttp.ClientTimeout(
             total=None, connect=60, sock_connect=60, sock_read=None
         )
 
-    def _auth_header(self) -> str:
-        token = base64.b64encode(f"{self._username}:{self._password}".encode("utf-8")).decode("ascii")
-        return f"Basic {token}"
-
-    def _headers(self, extra: dict[str, str] | None = None) -> dict[str, str]:
-        headers = {"Authorization": self._auth_header()}
-        if extra:
-            headers.update(extra)
-        return headers
-
-    def _folder_rel(self) -> str:
-        p = self._backup_path.strip()
-        if not p.startswith("/"):
-            p = "/" + p
-        return p.lstrip("/")
+    def _headers(self, extra: Mapping[str, str] | None = None) -> dict[str, str]:
+        # aiohttp copies request headers, so the shared dicts are never mutated.
+        if not extra:
+            return self._base_headers
+        for template, prebuilt in self._prebuilt_headers:
+            if extra is template:
+                return prebuilt
+        return {**self._base_headers, **extra}
 
     async def _pick_working_root(self) -> str:
         """Return a DAV root that works (by PROPFIND depth 0). Cache result."""
@@ -81,9 +167,7 @@ class WebDavClient:
                 async with self._session.request(
                     "PROPFIND",
                     url,
-                    headers=self._headers(
-                        {"Depth": "0", "Content-Type": "application/xml; charset=utf-8"}
-                    ),
+                    headers=self._headers(self._H_DEPTH0_XML),
                     data=(
                         b'<?xml version="1.0"?>'
                         b'<d:propfind xmlns:d="DAV:"><d:prop><d:resourcetype/></d:prop></d:propfind>'
@@ -92,6 +176,8 @@ class WebDavClient:
                     timeout=self._timeout_long,
                 ):
                     self._cached_root = root
+                    if self._on_root_detected is not None:
+                        self._on_root_detected(root)
                     return root
             except Exception as err:  # noqa: BLE001
                 last_err = err
@@ -99,9 +185,24 @@ class WebDavClient:
         raise last_err or RuntimeError("No working DAV root found")
 
     async def _base_folder_url(self) -> str:
+        if self._cached_folder_url is not None:
+            return self._cached_folder_url
+
         root = await self._pick_working_root()
-        rel = self._folder_rel().strip("/")
-        return urljoin(self._base_url, root + (rel + "/" if rel else ""))
+        rel = self._folder_rel.strip("/")
+        self._cached_folder_url = urljoin(self._base_url, root + (rel + "/" if rel else ""))
+        return self._cached_folder_url
+
+    def reset_cache(self) -> None:
+        """Forget the detected DAV root, resolved folder URL and cached responses."""
+        self._cached_root = None
+        self._cached_folder_url = None
+        self._listdir_cache = None
+        self._bytes_cache.clear()
+        self._sync_supported = None
+        self._sync_token = None
+        self._sync_entries = None
+        self._sync_failures = 0
 
     async def ensure_backup_folder(self) -> None:
         """Ensure the backup folder exists (create intermediate folders best-effort)."""
@@ -112,7 +213,7 @@ class WebDavClient:
             async with self._session.request(
                 "PROPFIND",
                 base_folder,
-                headers=self._headers({"Depth": "0"}),
+                headers=self._headers(self._H_DEPTH0),
                 raise_for_status=True,
                 timeout=self._timeout_long,
             ):
@@ -120,12 +221,19 @@ class WebDavClient:
         except ClientResponseError as err:
             if err.status in (401, 403):
                 raise
+            if err.status in (404, 405) and self._root_prefilled:
+                # The persisted DAV root may no longer be served: rediscover once.
+                _LOGGER.debug("Backup folder not found under persisted DAV root; rediscovering")
+                self._root_prefilled = False
+                self.reset_cache()
+                await self.ensure_backup_folder()
+                return
         except Exception:
             pass
 
         # Create folders one by one using MKCOL
         root = await self._pick_working_root()
-        parts = [p for p in self._folder_rel().split("/") if p]
+        parts = [p for p in self._folder_rel.split("/") if p]
         current = urljoin(self._base_url, root)
 
         for part in parts:
@@ -138,7 +246,7 @@ class WebDavClient:
             async with self._session.request(
                 "PROPFIND",
                 url,
-                headers=self._headers({"Depth": "0"}),
+                headers=self._headers(self._H_DEPTH0),
                 raise_for_status=True,
                 timeout=self._timeout_long,
             ):
@@ -156,69 +264,299 @@ class WebDavClient:
             text = await resp.text()
             raise RuntimeError(f"MKCOL failed ({resp.status}): {text}")
 
-    async def listdir(self) -> list[str]:
-        """List file names in backup folder (Depth: 1)."""
+    def invalidate_listdir(self) -> None:
+        """Drop the cached folder listing."""
+        self._cache_generation += 1
+        self._listdir_cache = None
+
+    def _invalidate_name(self, name: str) -> None:
+        self.invalidate_listdir()
+        self._bytes_cache.pop(name, None)
+
+    async def listdir(self) -> list[dict[str, object]]:
+        """List entries in backup folder (Depth: 1), cached for a short TTL.
+
+        Each entry carries the same keys as stat() plus "name" and "is_dir".
+        """
+        cached = self._listdir_cache
+        if cached is not None and time.monotonic() - cached[0] < self._listdir_ttl:
+            return list(cached[1])
+
+        generation = self._cache_generation
+        entries = await self._listdir_uncached()
+        if generation == self._cache_generation:
+            self._listdir_cache = (time.monotonic(), entries)
+        return list(entries)
+
+    async def listdir_names(self) -> list[str]:
+        """List file names in backup folder."""
+        return [str(e["name"]) for e in await self.listdir()]
+
+    async def _listdir_uncached(self) -> list[dict[str, object]]:
+        if self._sync_supported is not False:
+            entries = await self._listdir_sync()
+            if entries is not None:
+                return entries
+        return await self._listdir_propfind()
+
+    async def _listdir_propfind(self) -> list[dict[str, object]]:
         folder = await self._base_folder_url()
 
         async with self._session.request(
             "PROPFIND",
             folder,
-            headers=self._headers({"Depth": "1", "Content-Type": "application/xml; charset=utf-8"}),
-            data=(
-                b'<?xml version="1.0"?>'
-                b'<d:propfind xmlns:d="DAV:"><d:prop><d:displayname/></d:prop></d:propfind>'
-            ),
+            headers=self._headers(self._H_DEPTH1_XML),
+            data=b'<?xml version="1.0"?><d:propfind xmlns:d="DAV:">' + _LISTDIR_PROPS + b"</d:propfind>",
             raise_for_status=True,
             timeout=self._timeout_long,
         ) as resp:
-            body = await resp.text()
+            entries, _removed, _token = await self._read_multistatus(resp)
+
+        return [entries[name] for name in sorted(entries)]
+
+    async def _listdir_sync(self) -> list[dict[str, object]] | None:
+        """List the folder via a sync-collection REPORT (RFC 6578).
 
+        After the first full sync only members changed since the stored
+        sync-token are transferred and merged into the previous result.
+        Returns None if the server does not support it; the caller then
+        falls back to PROPFIND.
+        """
+        folder = await self._base_folder_url()
+        token = self._sync_token if self._sync_entries is not None else None
+
+        body = (
+            b'<?xml version="1.0"?>'
+            b'<d:sync-collection xmlns:d="DAV:">'
+            b"<d:sync-token>" + xml_escape(token or "").encode("utf-8") + b"</d:sync-token>"
+            b"<d:sync-level>1</d:sync-level>" + _LISTDIR_PROPS + b"</d:sync-collection>"
+        )
+
+        changed: dict[str, dict[str, object]] | None = None
+        async with self._session.request(
+            "REPORT",
+            folder,
+            headers=self._headers(self._H_DEPTH0_XML),
+            data=body,
+            timeout=self._timeout_long,
+        ) as resp:
+            status = resp.status
+            if status == 401:
+                resp.raise_for_status()
+            if status in (200, 207):
+                changed, removed, new_token = await self._read_multistatus(resp)
+
+        if changed is None:
+            if token is not None and status in (403, 409):
+                # Token expired or rejected: start over with a full sync
+                self._sync_token = None
+                self._sync_entries = None
+                return await self._listdir_sync()
+            if status == 501 or 400 <= status < 500:
+                _LOGGER.debug("sync-collection REPORT not supported (%s); using PROPFIND", status)
+                self._sync_supported = False
+            elif status >= 500:
+                # Don't pay for REPORT + PROPFIND on every listing against a broken server.
+                self._sync_failures += 1
+                if self._sync_failures >= SYNC_MAX_FAILURES:
+                    _LOGGER.debug("sync-collection REPORT keeps failing (%s); using PROPFIND", status)
+                    self._sync_supported = False
+            return None
+
+        if new_token is None:
+            # Not a valid RFC 6578 response: don't trust the body as a full listing.
+            _LOGGER.debug("sync-collection REPORT returned no sync-token; using PROPFIND")
+            self._sync_supported = False
+            self._sync_token = None
+            self._sync_entries = None
+            return None
+
+        self._sync_supported = True
+        self._sync_failures = 0
+        entries = dict(self._sync_entries) if token is not None and self._sync_entries else {}
+        for name in removed:
+            entries.pop(name, None)
+        entries.update(changed)
+
+        self._sync_entries = entries
+        self._sync_token = new_token
+        return [entries[name] for name in sorted(entries)]
+
+    async def _read_multistatus(
+        self, resp: aiohttp.ClientResponse
+    ) -> tuple[dict[str, dict[str, object]], set[str], str | None]:
+        """Stream-parse a multistatus body into (entries, removed names, sync-token)."""
+        # Each <d:response> is handled and detached from the root as soon as it is
+        # complete, so memory stays bounded regardless of the number of entries.
+        parser = XMLPullParser(events=("start", "end"))
+        entries: dict[str, dict[str, object]] = {}
+        removed: set[str] = set()
+        state = _MultistatusState()
         try:
-            root = ET.fromstring(body)
-        except ET.ParseError as err:
-            raise RuntimeError(f"Invalid PROPFIND response XML: {err}") from err
-
-        names: list[str] = []
-        for response in root.findall(f"{DAV_NS}response"):
-            href_el = response.find(f"{DAV_NS}href")
-            if href_el is None or not href_el.text:
+            async for chunk in resp.content.iter_chunked(PROPFIND_READ_CHUNK):
+                parser.feed(chunk)
+                self._collect_listdir_entries(parser, state, entries, removed)
+            parser.close()
+        except XML_PARSE_ERRORS as err:
+            raise RuntimeError(f"Invalid WebDAV multistatus XML: {err}") from err
+        self._collect_listdir_entries(parser, state, entries, removed)
+        return entries, removed, state.token
+
+    def _collect_listdir_entries(
+        self,
+        parser: XMLPullParser,
+        state: _MultistatusState,
+        entries: dict[str, dict[str, object]],
+        removed: set[str],
+    ) -> None:
+        for event, elem in parser.read_events():
+            if event == "start":
+                if state.root is None:
+                    state.root = elem
+                continue
+            if elem.tag == f"{DAV_NS}sync-token":
+                state.token = (elem.text or "").strip() or None
+                continue
+            if elem.tag != f"{DAV_NS}response":
                 continue
 
-            href = href_el.text
-            try:
-                u = URL(href)
-                seg = u.path.rstrip("/").split("/")[-1]
-            except Exception:
-                seg = href.rstrip("/").split("/")[-1]
+            self._handle_listdir_response(elem, entries, removed)
 
-            if not seg:
-                continue
+            elem.clear()
+            if state.root is not None and state.root is not elem:
+                state.root.remove(elem)
 
-            # Skip directory itself
-            folder_leaf = self._folder_rel().rstrip("/").split("/")[-1]
-            if seg == folder_leaf:
-                continue
+    def _handle_listdir_response(
+        self,
+        elem: ET.Element,
+        entries: dict[str, dict[str, object]],
+        removed: set[str],
+    ) -> None:
+        href_el = elem.find(f"{DAV_NS}href")
+        href = href_el.text if href_el is not None else None
+        if not href:
+            return
 
-            names.append(seg)
+        try:
+            u = URL(href)
+            seg = u.path.rstrip("/").split("/")[-1]
+        except Exception:
+            seg = href.rstrip("/").split("/")[-1]
+
+        # Skip directory itself
+        if not seg or seg == self._folder_leaf:
+            return
 
-        return sorted(set(names))
+        # Members removed since the last sync-token come back with a bare 404 status
+        status_el = elem.find(f"{DAV_NS}status")
+        if status_el is not None and status_el.text and " 404 " in status_el.text:
+            removed.add(seg)
+            return
+
+        info = _file_info_from_props(elem)
+        info["name"] = seg
+        info["is_dir"] = elem.find(f".//{DAV_NS}resourcetype/{DAV_NS}collection") is not None
+        entries[seg] = info
 
     def _file_url(self, folder_url: str, name: str) -> str:
         if not folder_url.endswith("/"):
             folder_url += "/"
+        # Fast path for our own file names: nothing to quote or resolve.
+        if _SAFE_NAME.match(name):
+            return folder_url + name
         return urljoin(folder_url, quote(name))
 
+    def _expect100(self, size: int) -> bool:
+        """Whether a PUT of this size should wait for 100 Continue before sending the body.
+
+        Lets the server reject (e.g. 401, 507 quota exceeded) after one round trip
+        instead of after the whole body has been uploaded.
+        """
+        return self._expect_continue and size > EXPECT_CONTINUE_MIN_BYTES
+
+    def set_expect_continue(self, enabled: bool) -> None:
+        """Enable or disable Expect: 100-continue for later uploads."""
+        self._expect_continue = enabled
+
+    async def _put(
+        self,
+        name: str,
+        url: str,
+        data: bytes | AsyncIterator[bytes],
+        headers: dict[str, str],
+        size: int,
+    ) -> None:
+        """PUT a body and drop cached state for `name` once the request is over."""
+        try:
+            await self._put_body(url, data, headers, size)
+        finally:
+            # After the request: a listing that ran meanwhile must not keep the old state.
+            self._invalidate_name(name)
+
+    async def _put_body(
+        self, url: str, data: bytes | AsyncIterator[bytes], headers: dict[str, str], size: int
+    ) -> None:
+        """PUT a body; with Expect: 100-continue, fail if the server never says continue.
+
+        aiohttp has no continue timeout and our read timeout is unbounded, so a
+        server or proxy that ignores the Expect header would stall the upload forever.
+        """
+        if not self._expect100(size):
+            async with self._session.put(
+                url,
+                data=data,
+                headers=self._headers(headers),
+                raise_for_status=True,
+                timeout=self._timeout_long,
+            ):
+                return
+
+        started = asyncio.Event()
+
+        async def guarded() -> AsyncIterator[bytes]:
+            # aiohttp only starts reading the body after 100 Continue arrived.
+            started.set()
+            if isinstance(data, bytes):
+                yield data
+                return
+            async for chunk in data:
+                yield chunk
+
+        async def do_put() -> None:
+            async with self._session.put(
+                url,
+                data=guarded(),
+                headers=self._headers(headers),
+                expect100=True,
+                raise_for_status=True,
+                timeout=self._timeout_long,
+            ):
+                return
+
+        put_task = asyncio.create_task(do_put())
+        started_task = asyncio.create_task(started.wait())
+        try:
+            await asyncio.wait(
+                (put_task, started_task),
+                timeout=EXPECT_CONTINUE_TIMEOUT,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not put_task.done() and not started.is_set():
+                put_task.cancel()
+                raise TimeoutError(
+                    f"No 100 Continue from server within {EXPECT_CONTINUE_TIMEOUT:.0f}s; "
+                    "disable Expect: 100-continue in the integration options"
+                )
+            await put_task
+        finally:
+            started_task.cancel()
+            if not put_task.done():
+                put_task.cancel()
+
     async def put_bytes(self, name: str, data: bytes) -> None:
         folder = await self._base_folder_url()
         url = self._file_url(folder, name)
-        async with self._session.put(
-            url,
-            data=data,
-            headers=self._headers({"Content-Length": str(len(data))}),
-            raise_for_status=True,
-            timeout=self._timeout_long,
-        ):
-            return
+        await self._put(name, url, data, {"Content-Length": str(len(data))}, len(data))
 
     async def put_file(self, name: str, path: str, size: int) -> None:
         """Upload a local file with an explicit Content-Length (non-chunked)."""
@@ -228,31 +566,99 @@ class WebDavClient:
         # Ensure correct size if caller passes 0/unknown
         if size <= 0:
             try:
-                size = os.path.getsize(path)
+                size = await asyncio.to_thread(os.path.getsize, path)
             except OSError:
                 size = 0
 
         headers = {"Content-Length": str(size)} if size > 0 else {}
 
-        # aiohttp will stream file content; with Content-Length set, proxies are usually happier.
-        with open(path, "rb") as f:
-            async with self._session.put(
-                url,
-                data=f,
-                headers=self._headers(headers),
-                raise_for_status=True,
-                timeout=self._timeout_long,
-            ):
-                return
+        # Read the file in the executor so the event loop never blocks on disk I/O;
+        # with Content-Length set, proxies are usually happier.
+        async def body() -> AsyncIterator[bytes]:
+            fd = await asyncio.to_thread(os.open, path, os.O_RDONLY)
+            try:
+                while True:
+                    data = await asyncio.to_thread(os.read, fd, UPLOAD_READ_CHUNK)
+                    if not data:
+                        break
+                    yield data
+            finally:
+                await asyncio.to_thread(os.close, fd)
+
+        await self._put(name, url, body(), headers, size)
+
+    async def put_async_iter(self, name: str, stream: AsyncIterator[bytes], size: int) -> None:
+        """Upload an async byte stream with an explicit Content-Length (non-chunked).
+
+        The stream must yield exactly `size` bytes; otherwise the upload is aborted
+        with a RuntimeError instead of storing a truncated file.
+        """
+        folder = await self._base_folder_url()
+        url = self._file_url(folder, name)
+
+        size_error: RuntimeError | None = None
+
+        async def counted() -> AsyncIterator[bytes]:
+            nonlocal size_error
+            sent = 0
+            async for chunk in stream:
+                sent += len(chunk)
+                if sent > size:
+                    size_error = RuntimeError(f"Upload stream for {name} exceeds expected size {size}")
+                    raise size_error
+                yield chunk
+            if sent != size:
+                size_error = RuntimeError(f"Upload stream for {name} ended at {sent} of {size} bytes")
+                raise size_error
+
+        # With Content-Length set, aiohttp sends the iterable payload as-is
+        # instead of falling back to Transfer-Encoding: chunked.
+        try:
+            await self._put(name, url, counted(), {"Content-Length": str(size)}, size)
+        except Exception as err:
+            # aiohttp may wrap errors raised by the body; report the size mismatch itself.
+            if size_error is not None and err is not size_error:
+                raise size_error from err
+            raise
 
     async def get_bytes(self, name: str) -> bytes:
+        """Download a small file; bodies are kept in a bounded LRU cache.
+
+        Cached bodies are served directly for BYTES_CACHE_TTL and revalidated
+        with If-None-Match afterwards, so an unchanged file costs a bodyless 304.
+        """
+        cached = self._bytes_cache.get(name)
+        if cached is not None:
+            self._bytes_cache.move_to_end(name)
+            fetched_at, etag, data = cached
+            if time.monotonic() - fetched_at < BYTES_CACHE_TTL:
+                return data
+
+        extra = {"If-None-Match": cached[1]} if cached is not None and cached[1] else None
+        generation = self._cache_generation
+
         folder = await self._base_folder_url()
         url = self._file_url(folder, name)
-        async with self._session.get(url, headers=self._headers(), timeout=self._timeout_long) as resp:
+        async with self._session.get(url, headers=self._headers(extra), timeout=self._timeout_long) as resp:
             if resp.status == 404:
+                self._bytes_cache.pop(name, None)
                 raise FileNotFoundError(name)
-            resp.raise_for_status()
-            return await resp.read()
+            if resp.status == 304 and cached is not None:
+                etag, data = cached[1], cached[2]
+            else:
+                resp.raise_for_status()
+                etag = resp.headers.get("ETag")
+                data = await resp.read()
+
+        if generation != self._cache_generation:
+            # A write finished while we were fetching; the body may already be stale.
+            return data
+
+        self._bytes_cache[name] = (time.monotonic(), etag, data)
+        self._bytes_cache.move_to_end(name)
+        if len(self._bytes_cache) > BYTES_CACHE_MAX_ENTRIES:
+            self._bytes_cache.popitem(last=False)
+        return data
 
     async def get_stream(self, name: str) -> AsyncIterator[bytes]:
         folder = await self._base_folder_url()
@@ -265,7 +671,8 @@ class WebDavClient:
 
         async def iterator() -> AsyncIterator[bytes]:
             try:
-                async for chunk in resp.content.iter_chunked(1024 * 256):
+                # Yield whatever the socket delivered; no re-chunking copies.
+                async for chunk in resp.content.iter_any():
                     yield chunk
             finally:
                 resp.release()
@@ -275,13 +682,39 @@ class WebDavClient:
     async def delete(self, name: str) -> None:
         folder = await self._base_folder_url()
         url = self._file_url(folder, name)
-        async with self._session.delete(url, headers=self._headers(), timeout=self._timeout_long) as resp:
-            if resp.status == 404:
-                raise FileNotFoundError(name)
-            if resp.status in (200, 202, 204):
-                return
-            text = await resp.text()
-            raise RuntimeError(f"DELETE failed ({resp.status}): {text}")
+        try:
+            async with self._session.delete(url, headers=self._headers(), timeout=self._timeout_long) as resp:
+                if resp.status == 404:
+                    raise FileNotFoundError(name)
+                if resp.status in (200, 202, 204):
+                    return
+                text = await resp.text()
+                raise RuntimeError(f"DELETE failed ({resp.status}): {text}")
+        finally:
+            # After the request: a listing that ran meanwhile must not keep the old state.
+            self._invalidate_name(name)
+
+    async def move(self, src: str, dst: str) -> None:
+        """Rename a file inside the backup folder (overwrites the destination)."""
+        folder = await self._base_folder_url()
+        src_url = self._file_url(folder, src)
+        dst_url = self._file_url(folder, dst)
+        try:
+            async with self._session.request(
+                "MOVE",
+                src_url,
+                headers=self._headers({"Destination": dst_url, "Overwrite": "T"}),
+                timeout=self._timeout_long,
+            ) as resp:
+                if resp.status == 404:
+                    raise FileNotFoundError(src)
+                if resp.status in (201, 204):
+                    return
+                text = await resp.text()
+                raise RuntimeError(f"MOVE failed ({resp.status}): {text}")
+        finally:
+            self._invalidate_name(src)
+            self._invalidate_name(dst)
 
     async def stat(self, name: str) -> dict[str, object]:
         """Return size and modified time for a file using PROPFIND Depth: 0."""
@@ -301,7 +734,7 @@ class WebDavClient:
         async with self._session.request(
             "PROPFIND",
             url,
-            headers=self._headers({"Depth": "0", "Content-Type": "application/xml; charset=utf-8"}),
+            headers=self._headers(self._H_DEPTH0_XML),
             data=body,
             timeout=self._timeout_long,
         ) as resp:
@@ -319,26 +752,31 @@ class WebDavClient:
         if prop_el is None:
             raise RuntimeError("Invalid PROPFIND stat response (no prop)")
 
-        size_el = prop_el.find(f"{DAV_NS}getcontentlength")
-        lm_el = prop_el.find(f"{DAV_NS}getlastmodified")
+        return _file_info_from_props(prop_el)
 
-        size = int(size_el.text) if (size_el is not None and size_el.text) else 0
-        modified_raw = lm_el.text.strip() if (lm_el is not None and lm_el.text) else ""
 
-        modified_iso = ""
-        if modified_raw:
-            try:
-                dt = parsedate_to_datetime(modified_raw)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                modified_iso = dt.astimezone(timezone.utc).isoformat()
-            except Exception:  # noqa: BLE001
-                modified_iso = modified_raw
-        else:
-            modified_iso = datetime.now(timezone.utc).isoformat()
-
-        return {
-            "size": size,
-            "modified_raw": modified_raw,
-            "modified_iso": modified_iso,
-        }
+def _file_info_from_props(el: ET.Element) -> dict[str, object]:
+    """Extract size and modified time from a PROPFIND response/prop element."""
+    size_el = el.find(f".//{DAV_NS}getcontentlength")
+    lm_el = el.find(f".//{DAV_NS}getlastmodified")
+
+    size = int(size_el.text) if (size_el is not None and size_el.text) else 0
+    modified_raw = lm_el.text.strip() if (lm_el is not None and lm_el.text) else ""
+
+    modified_iso = ""
+    if modified_raw:
+        try:
+            dt = parsedate_to_datetime(modified_raw)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            modified_iso = dt.astimezone(timezone.utc).isoformat()
+        except Exception:  # noqa: BLE001
+            modified_iso = modified_raw
+    else:
+        modified_iso = datetime.now(timezone.utc).isoformat()
+
+    return {
+        "size": size,
+        "modified_raw": modified_raw,
+        "modified_iso": modified_iso,
+    }
@@ -0,0 +1,89 @@
+"""Tests for the backup agent's upload flow (needs Home Assistant)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant.components.backup")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.owncloud_backup import backup as backup_module  # noqa: E402
+from test_webdav_client import _client, _FakeResponse, _FakeSession, _FakeUpload, _stream  # noqa: E402
+
+TAR = "ha_backup_abc.tar"
+PENDING = "ha_backup_abc.json.pending"
+
+
+class _RoutingSession(_FakeSession):
+    """Answers by (method, file name); anything not listed succeeds."""
+
+    def __init__(self, statuses: dict[tuple[str, str], int] | None = None) -> None:
+        super().__init__([])
+        self._statuses = statuses or {}
+        self.requests: list[tuple[str, str]] = []
+
+    def _response(self, method: str, url: str, default: int) -> _FakeResponse:
+        name = url.rsplit("/", 1)[-1]
+        self.requests.append((method, name))
+        return _FakeResponse(self._statuses.get((method, name), default))
+
+    def request(self, method: str, url: str, **kwargs: object):
+        response = self._response(method, url, 201)
+        response.raise_on_enter = bool(kwargs.get("raise_for_status"))
+        return response
+
+    def put(self, url: str, *, data: object = None, **kwargs: object):
+        return _FakeUpload(data, self._response("PUT", url, 201))
+
+    def delete(self, url: str, **kwargs: object):
+        return self._response("DELETE", url, 204)
+
+
+def _upload(session: _RoutingSession) -> None:
+    agent = backup_module.OwnCloudBackupAgent(_client(session))
+    backup = SimpleNamespace(backup_id="abc", name="Nightly", size=5, protected=True)
+
+    async def open_stream():
+        return _stream(b"abc", b"de")
+
+    asyncio.run(agent.async_upload_backup(open_stream=open_stream, backup=backup))
+
+
+def test_upload_publishes_metadata_after_tar() -> None:
+    session = _RoutingSession()
+
+    _upload(session)
+    assert sorted(session.requests[:2]) == [("PUT", PENDING), ("PUT", TAR)]
+    assert session.requests[2:] == [("MOVE", PENDING)]
+
+
+def test_upload_tar_failure_discards_pending_metadata() -> None:
+    session = _RoutingSession({("PUT", TAR): 507})
+
+    with pytest.raises(backup_module.BackupAgentError):
+        _upload(session)
+    assert ("MOVE", PENDING) not in session.requests
+    assert session.requests[-1] == ("DELETE", PENDING)
+
+
+def test_upload_move_failure_discards_pending_metadata() -> None:
+    session = _RoutingSession({("MOVE", PENDING): 500})
+
+    with pytest.raises(backup_module.BackupAgentError, match="MOVE failed"):
+        _upload(session)
+    assert session.requests[-2:] == [("MOVE", PENDING), ("DELETE", PENDING)]
+
+
+def test_delete_keeps_metadata_when_tar_delete_fails() -> None:
+    session = _RoutingSession({("DELETE", TAR): 423})
+    agent = backup_module.OwnCloudBackupAgent(_client(session))
+
+    with pytest.raises(RuntimeError, match="DELETE failed"):
+        asyncio.run(agent.async_delete_backup("abc"))
+    assert session.requests == [("DELETE", TAR)]
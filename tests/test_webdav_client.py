@@ -0,0 +1,403 @@
+"""Tests for the WebDAV client (no Home Assistant required)."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+from aiohttp import ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[1] / "custom_components" / "owncloud_backup" / "webdav_client.py"
+)
+_spec = importlib.util.spec_from_file_location("owncloud_backup_webdav_client", _MODULE_PATH)
+webdav_client = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = webdav_client
+_spec.loader.exec_module(webdav_client)  # type: ignore[union-attr]
+
+FOLDER = "/remote.php/dav/files/user/Backups/"
+LAST_MODIFIED = "Wed, 14 Jan 2026 10:00:00 GMT"
+
+
+def _multistatus(files: list[str], removed: list[str] = (), token: str | None = None) -> bytes:
+    body = '<?xml version="1.0"?><d:multistatus xmlns:d="DAV:">'
+    body += f"<d:response><d:href>{FOLDER}</d:href></d:response>"
+    for name in files:
+        body += (
+            f"<d:response><d:href>{FOLDER}{name}</d:href><d:propstat><d:prop>"
+            f"<d:getcontentlength>5</d:getcontentlength>"
+            f"<d:getlastmodified>{LAST_MODIFIED}</d:getlastmodified>"
+            f"<d:resourcetype/></d:prop><d:status>HTTP/1.1 200 OK</d:status></d:propstat></d:response>"
+        )
+    for name in removed:
+        body += (
+            f"<d:response><d:href>{FOLDER}{name}</d:href>"
+            f"<d:status>HTTP/1.1 404 Not Found</d:status></d:response>"
+        )
+    if token is not None:
+        body += f"<d:sync-token>{token}</d:sync-token>"
+    return (body + "</d:multistatus>").encode("utf-8")
+
+
+class _FakeContent:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def iter_chunked(self, size: int):
+        for i in range(0, len(self._body), size):
+            yield self._body[i : i + size]
+
+
+class _FakeResponse:
+    def __init__(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None) -> None:
+        self.status = status
+        self.headers: dict[str, str] = headers or {}
+        self._body = body
+        self.content = _FakeContent(body)
+        self.raise_on_enter = False
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return ""
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            url = URL("https://cloud.example.com/")
+            request_info = RequestInfo(url, "GET", CIMultiDictProxy(CIMultiDict()), url)
+            raise ClientResponseError(request_info, (), status=self.status)
+
+    async def __aenter__(self) -> _FakeResponse:
+        if self.raise_on_enter:
+            self.raise_for_status()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+
+class _FakeSession:
+    """Replays canned responses and records (method, body) per request."""
+
+    def __init__(self, responses: list[_FakeResponse]) -> None:
+        self._responses = list(responses)
+        self.calls: list[tuple[str, bytes | None]] = []
+        self.get_headers: list[dict[str, str]] = []
+
+    def request(self, method: str, url: str, *, data: bytes | None = None, **kwargs: object):
+        self.calls.append((method, data))
+        response = self._responses.pop(0)
+        response.raise_on_enter = bool(kwargs.get("raise_for_status"))
+        return response
+
+    def put(self, url: str, *, data: object = None, **kwargs: object):
+        self.calls.append(("PUT", None))
+        return _FakeUpload(data, self._responses.pop(0))
+
+    def get(self, url: str, *, headers: dict[str, str] | None = None, **kwargs: object):
+        self.calls.append(("GET", None))
+        self.get_headers.append(headers or {})
+        return self._responses.pop(0)
+
+
+class _FakeUpload:
+    """Drains an async iterable request body, like aiohttp does when sending it."""
+
+    def __init__(self, body: object, response: _FakeResponse) -> None:
+        self._body = body
+        self._response = response
+        self.received = b""
+
+    async def __aenter__(self) -> _FakeResponse:
+        if hasattr(self._body, "__aiter__"):
+            async for chunk in self._body:
+                self.received += chunk
+        self._response.raise_for_status()
+        return self._response
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+
+def _client(session: _FakeSession):
+    client = webdav_client.WebDavClient(
+        session=session,  # type: ignore[arg-type]
+        base_url="https://cloud.example.com",
+        username="user",
+        password="secret",
+        backup_path="/Backups",
+        dav_root="remote.php/dav/files/user/",
+    )
+    # Disable the TTL cache so every listdir() hits the (fake) server.
+    client._listdir_ttl = 0
+    return client
+
+
+def _methods(session: _FakeSession) -> list[str]:
+    return [method for method, _data in session.calls]
+
+
+def test_listdir_without_sync_token_falls_back_to_propfind() -> None:
+    session = _FakeSession(
+        [
+            _FakeResponse(207, _multistatus(["stale.tar"])),
+            _FakeResponse(207, _multistatus(["a.tar", "b.tar"])),
+            _FakeResponse(207, _multistatus(["b.tar"])),
+        ]
+    )
+    client = _client(session)
+
+    async def run() -> list[list[str]]:
+        return [await client.listdir_names() for _ in range(2)]
+
+    assert asyncio.run(run()) == [["a.tar", "b.tar"], ["b.tar"]]
+    assert _methods(session) == ["REPORT", "PROPFIND", "PROPFIND"]
+    assert client._sync_supported is False
+
+
+def test_listdir_unsupported_report_falls_back_to_propfind() -> None:
+    session = _FakeSession(
+        [
+            _FakeResponse(403),
+            _FakeResponse(207, _multistatus(["a.tar"])),
+            _FakeResponse(207, _multistatus(["a.tar"])),
+        ]
+    )
+    client = _client(session)
+
+    async def run() -> list[list[str]]:
+        return [await client.listdir_names() for _ in range(2)]
+
+    assert asyncio.run(run()) == [["a.tar"], ["a.tar"]]
+    assert _methods(session) == ["REPORT", "PROPFIND", "PROPFIND"]
+
+
+def test_listdir_stops_trying_report_after_repeated_server_errors() -> None:
+    failures = webdav_client.SYNC_MAX_FAILURES
+    responses: list[_FakeResponse] = []
+    for _ in range(failures):
+        responses += [_FakeResponse(503), _FakeResponse(207, _multistatus(["a.tar"]))]
+    session = _FakeSession(responses + [_FakeResponse(207, _multistatus(["a.tar"]))])
+    client = _client(session)
+
+    async def run() -> list[list[str]]:
+        return [await client.listdir_names() for _ in range(failures + 1)]
+
+    assert asyncio.run(run()) == [["a.tar"]] * (failures + 1)
+    assert _methods(session) == ["REPORT", "PROPFIND"] * failures + ["PROPFIND"]
+    assert client._sync_supported is False
+
+
+def test_listdir_sync_merges_changes_and_removals() -> None:
+    session = _FakeSession(
+        [
+            _FakeResponse(207, _multistatus(["a.tar", "b.tar"], token="t1")),
+            _FakeResponse(207, _multistatus(["c.tar"], removed=["a.tar"], token="t2")),
+        ]
+    )
+    client = _client(session)
+
+    async def run() -> tuple[list[str], list[dict[str, object]]]:
+        return await client.listdir_names(), await client.listdir()
+
+    first, second = asyncio.run(run())
+    assert first == ["a.tar", "b.tar"]
+    assert [e["name"] for e in second] == ["b.tar", "c.tar"]
+    assert second[0]["size"] == 5
+    assert second[0]["modified_raw"] == LAST_MODIFIED
+
+    assert _methods(session) == ["REPORT", "REPORT"]
+    assert b"<d:sync-token></d:sync-token>" in session.calls[0][1]
+    assert b"<d:sync-token>t1</d:sync-token>" in session.calls[1][1]
+    assert client._sync_token == "t2"
+
+
+@pytest.mark.parametrize("status", [403, 409])
+def test_listdir_sync_rejected_token_resyncs(status: int) -> None:
+    session = _FakeSession(
+        [
+            _FakeResponse(207, _multistatus(["a.tar"], token="t1")),
+            _FakeResponse(status),
+            _FakeResponse(207, _multistatus(["z.tar"], token="t3")),
+        ]
+    )
+    client = _client(session)
+
+    async def run() -> list[list[str]]:
+        return [await client.listdir_names() for _ in range(2)]
+
+    assert asyncio.run(run()) == [["a.tar"], ["z.tar"]]
+    assert _methods(session) == ["REPORT", "REPORT", "REPORT"]
+    assert b"<d:sync-token>t1</d:sync-token>" in session.calls[1][1]
+    assert b"<d:sync-token></d:sync-token>" in session.calls[2][1]
+    assert client._sync_supported is True
+    assert client._sync_token == "t3"
+
+
+async def _stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def test_put_async_iter_accepts_exact_size() -> None:
+    session = _FakeSession([_FakeResponse(201)])
+    client = _client(session)
+
+    asyncio.run(client.put_async_iter("ha_backup_x.tar", _stream(b"abc", b"de"), 5))
+    assert _methods(session) == ["PUT"]
+
+
+@pytest.mark.parametrize(
+    ("chunks", "match"),
+    [
+        ((b"abc", b"def"), "exceeds expected size 5"),
+        ((b"abc",), "ended at 3 of 5 bytes"),
+    ],
+)
+def test_put_async_iter_rejects_size_mismatch(chunks: tuple[bytes, ...], match: str) -> None:
+    session = _FakeSession([_FakeResponse(201)])
+    client = _client(session)
+
+    with pytest.raises(RuntimeError, match=match):
+        asyncio.run(client.put_async_iter("ha_backup_x.tar", _stream(*chunks), 5))
+
+
+def test_ensure_backup_folder_rediscovers_stale_persisted_root() -> None:
+    session = _FakeSession(
+        [
+            _FakeResponse(404),  # folder under the persisted (stale) root
+            _FakeResponse(207),  # discovery: remote.php/dav/files/<user>/ works
+            _FakeResponse(207),  # folder under the rediscovered root
+        ]
+    )
+    detected: list[str] = []
+    client = webdav_client.WebDavClient(
+        session=session,  # type: ignore[arg-type]
+        base_url="https://cloud.example.com",
+        username="user",
+        password="secret",
+        backup_path="/Backups",
+        dav_root="remote.php/webdav/",
+        on_root_detected=detected.append,
+    )
+
+    asyncio.run(client.ensure_backup_folder())
+    assert _methods(session) == ["PROPFIND", "PROPFIND", "PROPFIND"]
+    assert detected == ["remote.php/dav/files/user/"]
+
+
+class _NoContinueSession(_FakeSession):
+    """Never sends 100 Continue nor a final response."""
+
+    def put(self, url: str, *, data: object = None, **kwargs: object):
+        self.calls.append(("PUT", None))
+        return _HangingUpload()
+
+
+class _HangingUpload:
+    async def __aenter__(self) -> None:
+        await asyncio.Event().wait()
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+
+def test_put_gives_up_when_server_never_sends_continue(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(webdav_client, "EXPECT_CONTINUE_TIMEOUT", 0.05)
+    client = _client(_NoContinueSession([]))
+    data = b"x" * (webdav_client.EXPECT_CONTINUE_MIN_BYTES + 1)
+
+    with pytest.raises(TimeoutError, match="100 Continue"):
+        asyncio.run(client.put_bytes("ha_backup_x.json", data))
+
+
+class _BlockingUpload:
+    """Upload that completes only once `release` is set."""
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self._release = release
+
+    async def __aenter__(self) -> None:
+        await self._release.wait()
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+
+def test_listing_during_upload_is_not_cached_past_the_write() -> None:
+    session = _FakeSession(
+        [
+            _FakeResponse(501),  # REPORT not supported
+            _FakeResponse(207, _multistatus(["a.tar"])),  # PROPFIND during upload
+            _FakeResponse(207, _multistatus(["a.tar", "b.tar"])),  # PROPFIND after upload
+        ]
+    )
+    client = _client(session)
+    client._listdir_ttl = 60
+    release = asyncio.Event()
+    session.put = lambda url, **kwargs: _BlockingUpload(release)  # type: ignore[method-assign]
+
+    async def run() -> tuple[list[str], list[str]]:
+        upload = asyncio.create_task(client.put_bytes("b.tar", b"data"))
+        await asyncio.sleep(0)
+        during = await client.listdir_names()
+        release.set()
+        await upload
+        return during, await client.listdir_names()
+
+    assert asyncio.run(run()) == (["a.tar"], ["a.tar", "b.tar"])
+
+
+def test_get_bytes_serves_cache_hit_without_request() -> None:
+    session = _FakeSession([_FakeResponse(200, b"{}", {"ETag": '"e1"'})])
+    client = _client(session)
+
+    async def run() -> list[bytes]:
+        return [await client.get_bytes("ha_backup_x.json") for _ in range(2)]
+
+    assert asyncio.run(run()) == [b"{}", b"{}"]
+    assert _methods(session) == ["GET"]
+
+
+def test_get_bytes_revalidates_with_etag_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(webdav_client, "BYTES_CACHE_TTL", 0)
+    session = _FakeSession([_FakeResponse(200, b"{}", {"ETag": '"e1"'}), _FakeResponse(304)])
+    client = _client(session)
+
+    async def run() -> list[bytes]:
+        return [await client.get_bytes("ha_backup_x.json") for _ in range(2)]
+
+    assert asyncio.run(run()) == [b"{}", b"{}"]
+    assert "If-None-Match" not in session.get_headers[0]
+    assert session.get_headers[1]["If-None-Match"] == '"e1"'
+
+
+def test_get_bytes_404_evicts_cached_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(webdav_client, "BYTES_CACHE_TTL", 0)
+    session = _FakeSession([_FakeResponse(200, b"{}", {"ETag": '"e1"'}), _FakeResponse(404)])
+    client = _client(session)
+
+    asyncio.run(client.get_bytes("ha_backup_x.json"))
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(client.get_bytes("ha_backup_x.json"))
+    assert "ha_backup_x.json" not in client._bytes_cache
+
+
+def test_get_bytes_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(webdav_client, "BYTES_CACHE_MAX_ENTRIES", 2)
+    names = ["a.json", "b.json", "c.json"]
+    session = _FakeSession([_FakeResponse(200, name.encode()) for name in names])
+    client = _client(session)
+
+    async def run() -> None:
+        for name in names:
+            await client.get_bytes(name)
+
+    asyncio.run(run())
+    assert list(client._bytes_cache) == ["b.json", "c.json"]